@@ -1,46 +1,114 @@
+import bisect
 import datetime
-import os
+import functools
+import hashlib
 import logging
 import argparse  # For command-line arguments
-from google.auth.transport.requests import Request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import googleapiclient.model
+import orjson
 from pydantic import Field
 from scoutsdk.api import ScoutAPI  # Assuming you have a ScoutAPI module for API interactions
 from scoutsdk import scout
-import pytz  # Add this import for timezone handling
-import json
+from zoneinfo import ZoneInfo  # Stdlib timezone handling
+import numpy as np  # Vectorized slot scanning
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+
+class _OrjsonShim:
+    """Drop-in json module replacement backed by orjson."""
+    @staticmethod
+    def loads(payload, **kwargs):
+        return orjson.loads(payload)
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+
+# googleapiclient (de)serializes every request and response body with stdlib
+# json; orjson parses the large events.list payloads several times faster
+googleapiclient.model.json = _OrjsonShim
+
 # Set up the ScoutAPI client
 scout_api = ScoutAPI() # Ensure SCOUT_API_URL and SCOUT_API_ACCESS_TOKEN are set in your environment
 
+SCOPES = ['https://www.googleapis.com/auth/calendar']
+
+# How many attendees events.list returns per event; larger meetings come back
+# truncated, so the availability check must flag them
+EVENTS_MAX_ATTENDEES = 50
+
+# Slot-grid constants shared by every find_available_slot call
+SLOT_STEP_SECONDS = 15 * 60
+LUNCH_START_TIME = datetime.time(12, 0)
+LUNCH_END_TIME = datetime.time(13, 0)
+
+# Built service objects reused across invocations, keyed by a hash of the
+# stable credential fields; bounded so stale entries cannot pin connection
+# pools indefinitely
+_service_cache = {}
+_SERVICE_CACHE_MAX = 4
+
+def _service_cache_key(google_token_json, client_config):
+    """Builds a cache key from the stable credential fields.
+
+    Access tokens rotate roughly hourly, so hashing the whole token blob
+    would miss on every refreshed token. The refresh token and client id
+    identify the credentials; a rotated access token still hits.
+    """
+    token_dict = google_token_json
+    if isinstance(token_dict, str):
+        try:
+            token_dict = orjson.loads(token_dict)
+        except orjson.JSONDecodeError:
+            token_dict = None
+    if not isinstance(token_dict, dict):
+        # Fall back to hashing the raw values; an unparsable token will fail
+        # credential construction with a clear error further down anyway
+        return hashlib.sha256(repr((google_token_json, client_config)).encode()).hexdigest()
+    stable_fields = (token_dict.get('refresh_token'), token_dict.get('client_id'), client_config)
+    return hashlib.sha256(repr(stable_fields).encode()).hexdigest()
+
+
 def get_google_calendar_service():
     """Authenticates and returns a Google Calendar API service object."""
+    global _authed_session
     creds = None
 
     # Check if GOOGLE_TOKEN_JSON environment variable exists
     google_token_json = scout.context.get('GOOGLE_TOKEN_JSON')
+    client_config = scout.context.get("GOOGLE_CLIENT_CONFIG")
+
+    # Re-use the service built on a previous invocation when the configured
+    # credentials have not changed; build() alone costs ~100ms per call
+    cache_key = _service_cache_key(google_token_json, client_config)
+    cached = _service_cache.get(cache_key)
+    if cached is not None:
+        service, _authed_session = cached
+        logging.debug("Reusing cached Google Calendar service.")
+        return service
+
+    # Build credentials directly from the in-memory token; writing the secret
+    # to token.json and reading it back was pure overhead (and left a window
+    # with the secret on disk)
     if google_token_json:
         try:
-            # Serialize the dictionary to a JSON string if it's not already a string
-            if isinstance(google_token_json, dict):
-                google_token_json = json.dumps(google_token_json)
-            with open('token.json', 'w') as token_file:
-                token_file.write(google_token_json)
-            logging.info("GOOGLE_TOKEN_JSON environment variable found and written to token.json.")
+            if isinstance(google_token_json, str):
+                google_token_json = orjson.loads(google_token_json)
+            creds = Credentials.from_authorized_user_info(google_token_json, SCOPES)
+            logging.info("GOOGLE_TOKEN_JSON found; credentials built in memory.")
         except Exception as e:
-            logging.error(f"Failed to write GOOGLE_TOKEN_JSON to token.json: {e}")
+            logging.error(f"Failed to build credentials from GOOGLE_TOKEN_JSON: {e}")
             return None
 
-    # The file token.json stores the user's access and refresh tokens, and is
-    # created automatically when the authorization flow completes for the first
-    # time.
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', ['https://www.googleapis.com/auth/calendar'])
     # If there are no (valid) credentials available, let the user log in.
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -48,167 +116,329 @@ def get_google_calendar_service():
         else:
             from google_auth_oauthlib.flow import InstalledAppFlow
 
-            # Load client configuration from the environment variable
-            client_config = scout.context.get("GOOGLE_CLIENT_CONFIG")
+            # Client configuration was loaded from the environment variable above
             if not client_config:
                 logging.error("GOOGLE_CLIENT_CONFIG environment variable is not set.")
                 return None
 
             try:
-                client_config_dict = json.loads(client_config)
-            except json.JSONDecodeError:
+                client_config_dict = orjson.loads(client_config)
+            except orjson.JSONDecodeError:
                 logging.error("Invalid JSON format in GOOGLE_CLIENT_CONFIG.")
                 return None
 
-            flow = InstalledAppFlow.from_client_config(
-                client_config_dict, ['https://www.googleapis.com/auth/calendar']
-            )
+            flow = InstalledAppFlow.from_client_config(client_config_dict, SCOPES)
             creds = flow.run_local_server(port=0)
-        # Save the credentials for the next run
-        with open('token.json', 'w') as token:
-            token.write(creds.to_json())
+        # The refreshed credentials live on in the service cache; nothing is
+        # persisted to the local filesystem
 
     try:
-        service = build('calendar', 'v3', credentials=creds)
+        # Hot endpoints (freebusy) go through a requests.Session, which pools
+        # connections with keep-alive and is safe to share across threads,
+        # unlike the httplib2 transport underneath the service object
+        _authed_session = AuthorizedSession(creds)
+        # static_discovery uses the discovery document shipped with the client
+        # library instead of downloading it; cache_discovery=False suppresses
+        # the file-cache warning that would otherwise be logged
+        service = build('calendar', 'v3', credentials=creds,
+                        cache_discovery=False, static_discovery=True)
+        _service_cache[cache_key] = (service, _authed_session)
+        # Evict the oldest entries past the bound and release their transports
+        # (dicts iterate in insertion order)
+        while len(_service_cache) > _SERVICE_CACHE_MAX:
+            stale_service, stale_session = _service_cache.pop(next(iter(_service_cache)))
+            stale_session.close()
+            stale_service.close()
         return service
     except HttpError as error:
         logging.error(f'An error occurred: {error}')
         return None
 
 
-def get_meetings_to_reschedule(service, calendar_id, vacation_date):
-    """Retrieves meetings owned by you on the specified vacation date."""
-    meetings_to_reschedule = []
-    start_of_day = datetime.datetime.combine(vacation_date, datetime.time.min).isoformat() + 'Z'
-    end_of_day = datetime.datetime.combine(vacation_date, datetime.time.max).isoformat() + 'Z'
+_authed_session = None
+
+_FREEBUSY_URL = 'https://www.googleapis.com/calendar/v3/freeBusy'
+
+
+# Keeps service objects addressable by id() so _get_calendar can use a
+# hashable cache key instead of the service object itself
+_services = {}
+
+@functools.lru_cache(maxsize=16)
+def _get_calendar(service_id, calendar_id):
+    """Fetches calendar metadata once per calendar and caches it in-process."""
+    return _services[service_id].calendars().get(calendarId=calendar_id, fields='id,timeZone').execute()
+
+
+def fetch_vacation_day_events(service, calendar_id, vacation_dates):
+    """Fetches each vacation day's events in batched HTTP requests, following pagination."""
+    events_by_date = {vacation_date: [] for vacation_date in vacation_dates}
+    next_pages = {}
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            logging.error(f'An error occurred fetching events for {request_id}: {exception}')
+            return
+        vacation_date = datetime.date.fromisoformat(request_id)
+        events_by_date[vacation_date].extend(response.get('items', []))
+        if response.get('nextPageToken'):
+            next_pages[vacation_date] = response['nextPageToken']
+
+    def _list_request(vacation_date, page_token):
+        start_of_day = datetime.datetime.combine(vacation_date, datetime.time.min).isoformat() + 'Z'
+        end_of_day = datetime.datetime.combine(vacation_date, datetime.time.max).isoformat() + 'Z'
+        # eventTypes/showDeleted narrow the result server-side so birthdays,
+        # working-location entries, and cancellations never hit the wire
+        return service.events().list(calendarId=calendar_id,
+                                     timeMin=start_of_day,
+                                     timeMax=end_of_day,
+                                     singleEvents=True,
+                                     orderBy='startTime',
+                                     eventTypes='default',
+                                     showDeleted=False,
+                                     maxAttendees=EVENTS_MAX_ATTENDEES,
+                                     maxResults=2500,
+                                     pageToken=page_token,
+                                     fields='items(id,summary,start,end,organizer/email,attendees/email,eventType,transparency),nextPageToken')
+
+    # The per-service /batch/calendar/v3 endpoint sends all the events.list
+    # requests in one multipart HTTP round-trip instead of one per date; dates
+    # with a nextPageToken get a follow-up batch until every page is in
+    pending = {vacation_date: None for vacation_date in vacation_dates}
+    while pending:
+        batch = service.new_batch_http_request(callback=_collect)
+        for vacation_date, page_token in pending.items():
+            batch.add(_list_request(vacation_date, page_token), request_id=vacation_date.isoformat())
 
-    try:
-        events_result = service.events().list(calendarId=calendar_id,
-                                              timeMin=start_of_day,
-                                              timeMax=end_of_day,
-                                              singleEvents=True,
-                                              orderBy='startTime').execute()
-        events = events_result.get('items', [])
-
-        # Get the calendar information to determine the owner's email
-        calendar = service.calendars().get(calendarId=calendar_id).execute()
-        owner_email = calendar.get('id')
-
-        logging.info(f"Found {len(events)} events on {vacation_date}")  # Log the number of events found
-
-        for event in events:
-            # Only include events with eventType: default
-            if event.get('eventType') != 'default':
-                logging.info(f"Skipping non-default event: {event.get('summary', 'No Summary')}")
-                continue
+        try:
+            batch.execute()
+        except HttpError as error:
+            logging.error(f'An error occurred: {error}')
+            break
 
-            if event.get('organizer', {}).get('email') == owner_email:  # Check if you are the organizer
-                meetings_to_reschedule.append(event)
-                logging.info(f"Event '{event.get('summary', 'No Summary')}' added to reschedule list.") # Log when an event is added
+        pending = dict(next_pages)
+        next_pages.clear()
 
-    except HttpError as error:
-        logging.error(f'An error occurred: {error}')
+    return events_by_date
 
-    return meetings_to_reschedule
 
-def find_available_slot(service, calendar_id, new_date, meeting_duration_minutes, time_slot_start, time_slot_end, attendees_emails, timezone, reserved_slots):
-    """Finds an available time slot on the given date, ensuring all attendees are free and avoiding reserved slots."""
-    # Combine date and time, then localize to the calendar's timezone
-    start_time = timezone.localize(datetime.datetime.combine(new_date, time_slot_start))
-    end_time = timezone.localize(datetime.datetime.combine(new_date, time_slot_end))
+def get_meetings_to_reschedule(vacation_date, events, owner_email):
+    """Filters the given day's events down to meetings owned by you."""
+    meetings_to_reschedule = []
 
-    # Convert to RFC3339 format with timezone information
-    start_time_iso = start_time.isoformat()
-    end_time_iso = end_time.isoformat()
+    logging.info(f"Found {len(events)} events on {vacation_date}")  # Log the number of events found
 
-    logging.debug(f"Searching for available slots on {new_date} between {start_time} and {end_time}")
-    logging.debug(f"Meeting duration: {meeting_duration_minutes} minutes")
+    for event in events:
+        # eventType filtering already happened server-side via eventTypes
+        if event.get('organizer', {}).get('email') == owner_email:  # Check if you are the organizer
+            meetings_to_reschedule.append(event)
+            logging.info(f"Event '{event.get('summary', 'No Summary')}' added to reschedule list.") # Log when an event is added
 
-    lunch_start = timezone.localize(datetime.datetime.combine(new_date, datetime.time(12, 0)))
-    lunch_end = timezone.localize(datetime.datetime.combine(new_date, datetime.time(13, 0)))
+    return meetings_to_reschedule
 
-    try:
-        # Fetch events in the specified time range
-        events_result = service.events().list(calendarId=calendar_id,
-                                              timeMin=start_time_iso,
-                                              timeMax=end_time_iso,
-                                              singleEvents=True,
-                                              orderBy='startTime').execute()
-        events = events_result.get('items', [])
-        logging.debug(f"Found {len(events)} events in the time range.")
-
-        # Iterate through possible time slots
-        current_time = start_time
-        while current_time + datetime.timedelta(minutes=meeting_duration_minutes) <= end_time:
-            slot_start = current_time
-            slot_end = current_time + datetime.timedelta(minutes=meeting_duration_minutes)
-
-            # Skip slots that overlap with lunch time
-            if slot_start < lunch_end and slot_end > lunch_start:
-                logging.debug(f"Skipping slot during lunch time: {slot_start} to {slot_end}")
-                current_time += datetime.timedelta(minutes=15)
+def _fetch_busy_intervals(calendar_id, time_min_iso, time_max_iso, attendees_emails):
+    """Queries freebusy for the given window and returns merged busy intervals."""
+    # Query everyone's availability for the whole window in one freebusy call.
+    # Including calendar_id covers our own events too, so a separate events
+    # fetch is not needed.
+    freebusy_request = {
+        "timeMin": time_min_iso,
+        "timeMax": time_max_iso,
+        "items": [{"id": email} for email in attendees_emails] + [{"id": calendar_id}]
+    }
+
+    response = _authed_session.post(_FREEBUSY_URL, json=freebusy_request,
+                                    params={'fields': 'calendars'})
+    response.raise_for_status()
+    freebusy_result = orjson.loads(response.content)
+
+    # Collect every calendar's busy intervals as datetime tuples
+    busy_intervals = []
+    for calendar_key, calendar_data in freebusy_result.get('calendars', {}).items():
+        # A calendar that cannot be queried comes back with errors and an
+        # empty busy list; it would otherwise silently look free
+        if calendar_data.get('errors'):
+            logging.warning(f"freebusy could not resolve {calendar_key}: {calendar_data['errors']}")
+        for interval in calendar_data.get('busy', []):
+            interval_start = _parse_iso(interval['start'])
+            interval_end = _parse_iso(interval['end'])
+            busy_intervals.append((interval_start, interval_end))
+
+    # Sort and merge overlapping intervals so each slot is checked against
+    # a single non-overlapping list
+    busy_intervals.sort()
+    merged_busy = []
+    for interval_start, interval_end in busy_intervals:
+        if merged_busy and interval_start <= merged_busy[-1][1]:
+            merged_busy[-1] = (merged_busy[-1][0], max(merged_busy[-1][1], interval_end))
+        else:
+            merged_busy.append((interval_start, interval_end))
+
+    return merged_busy
+
+
+def _parse_iso(timestamp):
+    """Parses an RFC3339 timestamp into a tz-aware datetime."""
+    # The API returns UTC times with a 'Z' suffix, which fromisoformat only
+    # accepts from Python 3.11 on
+    return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def _overlaps_reserved(reserved_intervals, slot_start, slot_end):
+    """Checks whether [slot_start, slot_end) overlaps any reserved interval."""
+    # The intervals are kept sorted and non-overlapping, so the only one that
+    # can conflict is the last one starting before slot_end
+    index = bisect.bisect_left(reserved_intervals, (slot_end,))
+    return index > 0 and reserved_intervals[index - 1][1] > slot_start
+
+
+def _first_unreserved(candidate_slots, duration, reserved_intervals):
+    """Returns the first candidate slot that does not overlap a reserved interval."""
+    for candidate in candidate_slots:
+        if not _overlaps_reserved(reserved_intervals, candidate, candidate + duration):
+            return candidate
+    return None
+
+
+def _to_epoch_seconds(dt):
+    """Converts a tz-aware datetime to integer epoch seconds."""
+    return int(dt.timestamp())
+
+
+def prefetch_busy_intervals(calendar_id, acceptable_dates, attendee_sets, time_slot_start, time_slot_end, timezone, busy_cache):
+    """Warms the busy cache with one freebusy query per attendee set spanning all acceptable dates."""
+    # Per-day windows the planner will actually scan
+    day_windows = {
+        new_date: (datetime.datetime.combine(new_date, time_slot_start, tzinfo=timezone),
+                   datetime.datetime.combine(new_date, time_slot_end, tzinfo=timezone))
+        for new_date in acceptable_dates
+    }
+    if not day_windows:
+        return
+    range_min_iso = min(window_start for window_start, _ in day_windows.values()).isoformat()
+    range_max_iso = max(window_end for _, window_end in day_windows.values()).isoformat()
+
+    pending_sets = [
+        attendees for attendees in attendee_sets
+        if any((calendar_id, new_date, attendees) not in busy_cache for new_date in acceptable_dates)
+    ]
+    if not pending_sets:
+        return
+
+    def _worker(attendees):
+        return attendees, _fetch_busy_intervals(calendar_id, range_min_iso, range_max_iso, sorted(attendees))
+
+    # A single freebusy round-trip per attendee set covers every candidate
+    # date; fetches for different sets are independent, so run them in parallel
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_worker, attendees) for attendees in pending_sets]
+        for future in as_completed(futures):
+            try:
+                attendees, merged_busy = future.result()
+            except (HttpError, requests.RequestException) as error:
+                # Leave the entries unset; find_available_slot will retry them
+                logging.error(f'An error occurred prefetching busy intervals: {error}')
                 continue
 
-            # Check if the slot is already reserved
-            if slot_start in reserved_slots:
-                logging.debug(f"Skipping reserved slot: {slot_start}")
-                current_time += datetime.timedelta(minutes=15)
-                continue
+            # Partition the range's busy intervals into per-day cache entries
+            for new_date, (window_start, window_end) in day_windows.items():
+                busy_cache[(calendar_id, new_date, attendees)] = [
+                    interval for interval in merged_busy
+                    if interval[0] < window_end and interval[1] > window_start
+                ]
 
-            logging.debug(f"Checking slot: {slot_start} to {slot_end}")
+    logging.debug(f"Prefetched busy intervals for {len(pending_sets)} attendee sets across {len(acceptable_dates)} dates.")
 
-            # Check if the slot conflicts with any existing events
-            conflict = False
-            for event in events:
-                if event.get('transparency') == 'transparent':
-                    logging.debug(f"Ignoring event (not marked busy): {event.get('summary', 'No Summary')}")
-                    continue
 
-                event_start = event['start'].get('dateTime', event['start'].get('date'))
-                event_end = event['end'].get('dateTime', event['end'].get('date'))
+def find_available_slot(calendar_id, new_date, meeting_duration_minutes, time_slot_start, time_slot_end, attendees_emails, timezone, reserved_intervals, busy_cache, slot_cache):
+    """Finds an available time slot on the given date, ensuring all attendees are free and avoiding reserved slots."""
+    # Meetings with the same attendees and duration on the same day share one
+    # list of free slots; each caller just takes the first still-unreserved one
+    slot_key = (new_date, frozenset(attendees_emails), meeting_duration_minutes)
+    duration_delta = datetime.timedelta(minutes=meeting_duration_minutes)
+    cached_slots = slot_cache.get(slot_key)
+    if cached_slots is not None:
+        available_slot = _first_unreserved(cached_slots, duration_delta, reserved_intervals)
+        if available_slot is not None:
+            logging.debug(f"Reusing cached slot {available_slot} for {slot_key}")
+        else:
+            # Reservations only grow and the busy data is fixed, so a rescan
+            # could not do better than the cached candidates
+            logging.warning("No available slot found.")
+        return available_slot
 
-                if slot_start.isoformat() < event_end and slot_end.isoformat() > event_start:
-                    logging.debug(f"Conflict found with event: {event.get('summary', 'No Summary')}")
-                    conflict = True
-                    break
+    # Combine date and time directly in the calendar's timezone
+    start_time = datetime.datetime.combine(new_date, time_slot_start, tzinfo=timezone)
+    end_time = datetime.datetime.combine(new_date, time_slot_end, tzinfo=timezone)
 
-            if conflict:
-                current_time += datetime.timedelta(minutes=15)
-                continue
+    # Convert to RFC3339 format with timezone information
+    start_time_iso = start_time.isoformat()
+    end_time_iso = end_time.isoformat()
 
-            # Check attendees' availability using freebusy.query
-            freebusy_request = {
-                "timeMin": slot_start.isoformat(),
-                "timeMax": slot_end.isoformat(),
-                "items": [{"id": email} for email in attendees_emails]
-            }
-
-            freebusy_result = service.freebusy().query(body=freebusy_request).execute()
-            busy_calendars = [
-                calendar_id for calendar_id, calendar_data in freebusy_result.get('calendars', {}).items()
-                if calendar_data.get('busy')
-            ]
+    logging.debug(f"Searching for available slots on {new_date} between {start_time} and {end_time}")
+    logging.debug(f"Meeting duration: {meeting_duration_minutes} minutes")
 
-            if busy_calendars:
-                logging.debug(f"Conflict found for attendees: {', '.join(busy_calendars)}")
-                current_time += datetime.timedelta(minutes=15)
-                continue
+    lunch_start = datetime.datetime.combine(new_date, LUNCH_START_TIME, tzinfo=timezone)
+    lunch_end = datetime.datetime.combine(new_date, LUNCH_END_TIME, tzinfo=timezone)
 
-            # If no conflicts and not reserved, return the available slot
-            logging.debug(f"Available slot found: {slot_start}")
-            return slot_start
+    try:
+        # Reuse busy intervals fetched for an earlier meeting with the same
+        # attendees on the same day; only hit the API on a cache miss
+        cache_key = (calendar_id, new_date, frozenset(attendees_emails))
+        merged_busy = busy_cache.get(cache_key)
+        if merged_busy is None:
+            merged_busy = _fetch_busy_intervals(calendar_id, start_time_iso, end_time_iso, attendees_emails)
+            busy_cache[cache_key] = merged_busy
+        else:
+            logging.debug(f"Reusing cached busy intervals for {cache_key}")
+
+        logging.debug(f"Found {len(merged_busy)} busy intervals in the time range.")
+
+        # Vectorize the slot scan: build one int64 array of candidate slot
+        # starts in epoch seconds and mask out lunch, busy, and reserved slots
+        # in bulk; plain integer math avoids per-element datetime64 conversion
+        duration_seconds = meeting_duration_minutes * 60
+        slot_starts = np.arange(_to_epoch_seconds(start_time),
+                                _to_epoch_seconds(end_time) - duration_seconds + 1,
+                                SLOT_STEP_SECONDS, dtype=np.int64)
+        slot_ends = slot_starts + duration_seconds
+
+        # Skip slots that overlap with lunch time
+        free = ~((slot_starts < _to_epoch_seconds(lunch_end)) & (slot_ends > _to_epoch_seconds(lunch_start)))
+
+        # Mask slots overlapping any busy interval via broadcasting
+        if merged_busy:
+            busy_start_arr = np.array([_to_epoch_seconds(interval_start) for interval_start, _ in merged_busy], dtype=np.int64)
+            busy_end_arr = np.array([_to_epoch_seconds(interval_end) for _, interval_end in merged_busy], dtype=np.int64)
+            free &= ~((slot_starts[:, None] < busy_end_arr[None, :]) &
+                      (slot_ends[:, None] > busy_start_arr[None, :])).any(axis=1)
+
+        free_starts = slot_starts[free]
+        logging.debug(f"{free_starts.size} of {slot_starts.size} candidate slots are free.")
+
+        # Cache the whole list of busy/lunch-free slots, not just the first:
+        # reservations are filtered at selection time, so later meetings with
+        # the same key take the next candidate without any rescan, and the
+        # cache never needs invalidating when a slot is reserved
+        candidate_slots = [datetime.datetime.fromtimestamp(int(slot_ts), timezone) for slot_ts in free_starts]
+        slot_cache[slot_key] = candidate_slots
+
+        available_slot = _first_unreserved(candidate_slots, duration_delta, reserved_intervals)
+        if available_slot is not None:
+            logging.debug(f"Available slot found: {available_slot}")
+            return available_slot
 
         logging.warning("No available slot found.")
         return None  # No available slot found
 
-    except HttpError as error:
+    except (HttpError, requests.RequestException) as error:
         logging.error(f'An error occurred while searching for available slots: {error}')
         return None
 
 
 def reschedule_meeting(service, calendar_id, event, new_start_time):
     """Reschedules a meeting to the given start time."""
-    original_start_time = datetime.datetime.fromisoformat(event['start']['dateTime'].replace('Z', '+00:00'))
+    original_start_time = _parse_iso(event['start']['dateTime'])
     new_end_time = new_start_time + datetime.timedelta(minutes=get_meeting_duration(event))
 
     logging.info(f"Proposed change:")
@@ -217,11 +447,17 @@ def reschedule_meeting(service, calendar_id, event, new_start_time):
     logging.info(f"  New Time: {new_start_time.strftime('%Y-%m-%d %H:%M')}")
 
     try:
-        # Ensure dateTime fields are properly formatted with timezone information
-        event['start']['dateTime'] = new_start_time.isoformat()
-        event['end']['dateTime'] = new_end_time.isoformat()
-
-        updated_event = service.events().update(calendarId=calendar_id, eventId=event['id'], body=event).execute()
+        # Patch only the start/end times: events.update replaces the whole
+        # resource, and the events here were fetched with a fields mask, so a
+        # full update would strip descriptions, conference links, reminders,
+        # and attendee response statuses
+        updated_event = service.events().patch(
+            calendarId=calendar_id,
+            eventId=event['id'],
+            body={
+                'start': {'dateTime': new_start_time.isoformat()},
+                'end': {'dateTime': new_end_time.isoformat()},
+            }).execute()
         logging.info(f"Rescheduled meeting: {event['summary']} to {new_start_time}")
         return updated_event
 
@@ -231,8 +467,8 @@ def reschedule_meeting(service, calendar_id, event, new_start_time):
 
 def get_meeting_duration(event):
     """Calculates the duration of a meeting in minutes."""
-    start_time = datetime.datetime.fromisoformat(event['start']['dateTime'].replace('Z', '+00:00'))
-    end_time = datetime.datetime.fromisoformat(event['end']['dateTime'].replace('Z', '+00:00'))
+    start_time = _parse_iso(event['start']['dateTime'])
+    end_time = _parse_iso(event['end']['dateTime'])
     duration = (end_time - start_time).total_seconds() / 60
     return int(duration)
 
@@ -257,11 +493,13 @@ def reschedule_meetings(vacation_dates_str: str = Field(description="Comma-separ
             log("error", "Failed to get Google Calendar service.")
             return "\n".join(log_messages)
 
-        # Fetch the calendar's timezone
+        # Fetch the calendar's timezone and owner email (cached per calendar)
         try:
-            calendar = service.calendars().get(calendarId='primary').execute()
+            _services[id(service)] = service
+            calendar = _get_calendar(id(service), 'primary')
+            owner_email = calendar.get('id')
             calendar_timezone = calendar.get('timeZone', 'UTC')
-            timezone = pytz.timezone(calendar_timezone)
+            timezone = ZoneInfo(calendar_timezone)
             log("info", f"Using calendar timezone: {calendar_timezone}")
         except HttpError as error:
             log("error", f"Failed to fetch calendar timezone: {error}")
@@ -270,7 +508,7 @@ def reschedule_meetings(vacation_dates_str: str = Field(description="Comma-separ
         # Split and parse vacation dates
         try:
             vacation_dates = [
-                timezone.localize(datetime.datetime.strptime(date_str.strip(), '%Y-%m-%d')).date()
+                datetime.datetime.strptime(date_str.strip(), '%Y-%m-%d').date()
                 for date_str in vacation_dates_str.split(',')
             ]
         except ValueError:
@@ -280,7 +518,7 @@ def reschedule_meetings(vacation_dates_str: str = Field(description="Comma-separ
         # Parse acceptable dates for rescheduling
         try:
             acceptable_dates = [
-                timezone.localize(datetime.datetime.strptime(date_str.strip(), '%Y-%m-%d')).date()
+                datetime.datetime.strptime(date_str.strip(), '%Y-%m-%d').date()
                 for date_str in acceptable_dates_str.split(',')
             ]
         except ValueError:
@@ -289,17 +527,37 @@ def reschedule_meetings(vacation_dates_str: str = Field(description="Comma-separ
 
         # Parse time slot start and end in the calendar's timezone
         try:
-            time_slot_start = timezone.localize(datetime.datetime.strptime(time_slot_start_str, '%H:%M')).time()
-            time_slot_end = timezone.localize(datetime.datetime.strptime(time_slot_end_str, '%H:%M')).time()
+            # Naive times; find_available_slot attaches the calendar timezone
+            # when combining them with each candidate date
+            time_slot_start = datetime.datetime.strptime(time_slot_start_str, '%H:%M').time()
+            time_slot_end = datetime.datetime.strptime(time_slot_end_str, '%H:%M').time()
         except ValueError:
             log("error", "Invalid time slot format. Use HH:MM.")
             return "\n".join(log_messages)
 
-        reserved_slots = set()  # Track reserved slots to avoid conflicts
+        reserved_intervals = []  # Sorted (start, end) tuples of reserved slots
+        busy_cache = {}  # (calendar_id, date, frozenset(attendees)) -> merged busy intervals
+        slot_cache = {}  # (date, frozenset(attendees), duration) -> busy-free slot candidates
+
+        # Fetch all vacation days' events in one batched request up front
+        events_by_date = fetch_vacation_day_events(service, 'primary', vacation_dates)  # 'primary' is your main calendar
+
+        meetings_by_date = {
+            vacation_date: get_meetings_to_reschedule(vacation_date, events_by_date.get(vacation_date, []), owner_email)
+            for vacation_date in vacation_dates
+        }
+
+        # Warm the busy cache concurrently before the sequential planning loop
+        attendee_sets = {
+            frozenset(attendee['email'] for attendee in event.get('attendees', []) if 'email' in attendee)
+            for meetings in meetings_by_date.values() for event in meetings
+        }
+        prefetch_busy_intervals('primary', acceptable_dates, attendee_sets,
+                                time_slot_start, time_slot_end, timezone, busy_cache)
 
         # Process each vacation date
         for vacation_date in vacation_dates:
-            meetings_to_reschedule = get_meetings_to_reschedule(service, 'primary', vacation_date)  # 'primary' is your main calendar
+            meetings_to_reschedule = meetings_by_date[vacation_date]
             log("info", f"Meetings to reschedule on {vacation_date}: {len(meetings_to_reschedule)}")
 
             if not meetings_to_reschedule:
@@ -307,26 +565,36 @@ def reschedule_meetings(vacation_dates_str: str = Field(description="Comma-separ
                 continue
 
             for event in meetings_to_reschedule:
-                attendees_emails = [attendee['email'] for attendee in event.get('attendees', []) if 'email' in attendee]
+                attendees = event.get('attendees', [])
+                attendees_emails = [attendee['email'] for attendee in attendees if 'email' in attendee]
+
+                if len(attendees) >= EVENTS_MAX_ATTENDEES:
+                    log("warning", f"Meeting '{event.get('summary', 'No Summary')}' hit the "
+                                   f"{EVENTS_MAX_ATTENDEES}-attendee fetch cap; availability of "
+                                   f"attendees beyond the cap will not be checked.")
 
                 logging.debug(f"Attempting to find an available slot for meeting: '{event.get('summary', 'No Summary')}' "
                               f"with attendees: {', '.join(attendees_emails)}")
 
+                meeting_duration_minutes = get_meeting_duration(event)
+
                 for new_date in acceptable_dates:
-                    available_slot = find_available_slot(service, 'primary', new_date, get_meeting_duration(event), 
-                                                         time_slot_start, time_slot_end, attendees_emails, timezone, reserved_slots)
+                    available_slot = find_available_slot('primary', new_date, meeting_duration_minutes,
+                                                         time_slot_start, time_slot_end, attendees_emails, timezone, reserved_intervals,
+                                                         busy_cache, slot_cache)
 
-                    if available_slot and available_slot not in reserved_slots:
+                    if available_slot:
                         # Use the available_slot directly as it is already timezone-aware
                         new_start_time = available_slot
-                        reserved_slots.add(new_start_time)  # Mark the slot as reserved, even in dry run mode
+                        # Reserve the full interval, even in dry run mode, so a
+                        # shorter meeting cannot land inside it later
+                        bisect.insort(reserved_intervals,
+                                      (new_start_time, new_start_time + datetime.timedelta(minutes=meeting_duration_minutes)))
                         if dry_run:
                             log("info", f"Dry run: Meeting '{event['summary']}' would be rescheduled to {new_start_time}")
                         else:
                             reschedule_meeting(service, 'primary', event, new_start_time)
                         break
-                    elif available_slot in reserved_slots:
-                        log("info", f"Slot {available_slot} is already reserved. Searching for another slot.")
                 else:
                     log("warning", f"No available slot found for meeting: {event['summary']} on any of the acceptable dates.")
 
@@ -334,14 +602,6 @@ def reschedule_meetings(vacation_dates_str: str = Field(description="Comma-separ
         log("error", f"An unexpected error occurred: {e}")
 
     finally:
-        # Ensure token.json is erased from disk
-        if os.path.exists('token.json'):
-            try:
-                os.remove('token.json')
-                log("info", "token.json has been successfully deleted.")
-            except Exception as e:
-                log("error", f"Failed to delete token.json: {e}")
-
         # Return all collected log messages as a single string
         return "\n".join(log_messages)
 